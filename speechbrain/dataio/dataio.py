@@ -26,6 +26,10 @@ torchaudio_backend = get_torchaudio_backend()
 torchaudio.set_audio_backend(torchaudio_backend)
 logger = logging.getLogger(__name__)
 
+# Matches $-references for the CSV replacements syntax, compiled once here
+# instead of on every load call.
+variable_finder = re.compile(r"\$([\w.]+)")
+
 
 def load_data_json(json_path, replacements={}):
     """Loads JSON and recursively formats string values.
@@ -128,7 +132,11 @@ def load_data_csv(csv_path, replacements={}):
     with open(csv_path, newline="") as csvfile:
         result = {}
         reader = csv.DictReader(csvfile, skipinitialspace=True)
-        variable_finder = re.compile(r"\$([\w.]+)")
+        # Stringify the replacement values once, rather than for every
+        # occurrence of a $-reference on every row.
+        str_replacements = {
+            key: str(value) for key, value in replacements.items()
+        }
         for row in reader:
             # ID:
             try:
@@ -145,7 +153,7 @@ def load_data_csv(csv_path, replacements={}):
             for key, value in row.items():
                 try:
                     row[key] = variable_finder.sub(
-                        lambda match: str(replacements[match[1]]), value
+                        lambda match: str_replacements[match[1]], value
                     )
                 except KeyError:
                     raise KeyError(
@@ -10,6 +10,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Matches $-references for the CSV replacements syntax, compiled once here
+# instead of on every load call.
+variable_finder = re.compile(r"\$([\w.]+)")
 
 TORCHAUDIO_FORMATS = ["wav", "flac", "aac", "ogg", "flac", "mp3"]
 ITEM_POSTFIX = "_data"
@@ -148,7 +151,6 @@ def load_sb_extended_csv(csv_path, replacements={}):
     with open(csv_path, newline="") as csvfile:
         result = {}
         reader = csv.DictReader(csvfile, skipinitialspace=True)
-        variable_finder = re.compile(r"\$([\w.]+)")
         if not reader.fieldnames[0] == "ID":
             raise KeyError(
                 "CSV has to have an 'ID' field, with unique ids"
@@ -8,9 +8,14 @@ Authors
  * Samuele Cornell 2020
 """
 import torch
+import torch.fft
 import math
+import functools
 from packaging import version
 
+# torch.sinc was introduced in torch 1.8
+_TORCH_HAS_SINC = version.parse(torch.__version__) >= version.parse("1.8.0")
+
 
 def compute_amplitude(waveforms, lengths=None, amp_type="avg", scale="linear"):
     """Compute amplitude of a batch of waveforms.
@@ -48,10 +53,12 @@ def compute_amplitude(waveforms, lengths=None, amp_type="avg", scale="linear"):
     assert scale in ["linear", "dB"]
 
     if amp_type == "avg":
+        # The 1-norm fuses abs and sum into a single reduction, avoiding
+        # a full-size intermediate |waveforms| tensor.
+        wav_sum = torch.norm(waveforms, p=1, dim=1, keepdim=True)
         if lengths is None:
-            out = torch.mean(torch.abs(waveforms), dim=1, keepdim=True)
+            out = wav_sum / waveforms.size(1)
         else:
-            wav_sum = torch.sum(input=torch.abs(waveforms), dim=1, keepdim=True)
             out = wav_sum / lengths
     elif amp_type == "peak":
         out = torch.max(torch.abs(waveforms), dim=1, keepdim=True)[0]
@@ -188,10 +195,13 @@ def convolve1d(
     use_fft : bool
         When `use_fft` is passed `True`, then compute the convolution in the
         spectral domain using complex multiply. This is more efficient on CPU
-        when the size of the kernel is large (e.g. reverberation). WARNING:
-        Without padding, circular convolution occurs. This makes little
-        difference in the case of reverberation, but may make more difference
-        with different kernels.
+        when the size of the kernel is large (e.g. reverberation). Passing
+        `None` selects the FFT path automatically, for kernels longer than
+        512 samples on CPU. WARNING: Without padding, circular convolution
+        occurs. This makes little difference in the case of reverberation,
+        but may make more difference with different kernels. The output
+        length also differs from conv1d, which is why automatic selection
+        is not the default.
     rotation_index : int
         This option only applies if `use_fft` is true. If so, the kernel is
         rolled by this amount before convolution to shift the output location.
@@ -221,6 +231,12 @@ def convolve1d(
             input=waveform, pad=padding, mode=pad_type,
         )
 
+    # With use_fft=None, pick the FFT path for long kernels on CPU, where
+    # the O(N log N) spectral product beats direct O(N K) convolution
+    # (the crossover is around K ~ 500 for typical builds).
+    if use_fft is None:
+        use_fft = not waveform.is_cuda and kernel.size(-1) > 512
+
     # This approach uses FFT, which is more efficient if the kernel is large
     if use_fft:
 
@@ -232,35 +248,15 @@ def convolve1d(
             kernel = kernel[..., :zero_length]
             zero_length = 0
 
-        # Perform rotation to ensure alignment
-        zeros = torch.zeros(
-            kernel.size(0), kernel.size(1), zero_length, device=kernel.device
-        )
-        after_index = kernel[..., rotation_index:]
-        before_index = kernel[..., :rotation_index]
-        kernel = torch.cat((after_index, zeros, before_index), dim=-1)
+        # Pad to the signal length once, then roll to ensure alignment.
+        # This replaces slicing out the two kernel halves, allocating a
+        # zeros tensor, and concatenating the three pieces.
+        kernel = torch.nn.functional.pad(kernel, (0, zero_length))
+        kernel = torch.roll(kernel, shifts=-int(rotation_index), dims=-1)
 
         # Multiply in frequency domain to convolve in time domain
-        if version.parse(torch.__version__) > version.parse("1.6.0"):
-            import torch.fft as fft
-
-            result = fft.rfft(waveform) * fft.rfft(kernel)
-            convolved = fft.irfft(result, n=waveform.size(-1))
-        else:
-            f_signal = torch.rfft(waveform, 1)
-            f_kernel = torch.rfft(kernel, 1)
-            sig_real, sig_imag = f_signal.unbind(-1)
-            ker_real, ker_imag = f_kernel.unbind(-1)
-            f_result = torch.stack(
-                [
-                    sig_real * ker_real - sig_imag * ker_imag,
-                    sig_real * ker_imag + sig_imag * ker_real,
-                ],
-                dim=-1,
-            )
-            convolved = torch.irfft(
-                f_result, 1, signal_sizes=[waveform.size(-1)]
-            )
+        result = torch.fft.rfft(waveform) * torch.fft.rfft(kernel)
+        convolved = torch.fft.irfft(result, n=waveform.size(-1))
 
     # Use the implementation given by torch, which should be efficient on GPU
     else:
@@ -369,6 +365,18 @@ def dB_to_amplitude(SNR):
     return 10 ** (SNR / 20)
 
 
+@functools.lru_cache(maxsize=32)
+def _notch_filter_inputs(filter_width):
+    """Cached filter tap positions, centered on the middle tap."""
+    return torch.arange(filter_width) - filter_width // 2
+
+
+@functools.lru_cache(maxsize=32)
+def _notch_filter_window(filter_width):
+    """Cached Blackman window of the given width."""
+    return torch.blackman_window(filter_width)
+
+
 def notch_filter(notch_freq, filter_width=101, notch_width=0.05):
     """Returns a notch filter constructed from a high-pass and low-pass filter.
 
@@ -399,27 +407,36 @@ def notch_filter(notch_freq, filter_width=101, notch_width=0.05):
     assert 0 < notch_freq <= 1
     assert filter_width % 2 != 0
     pad = filter_width // 2
-    inputs = torch.arange(filter_width) - pad
+    inputs = _notch_filter_inputs(filter_width)
 
     # Avoid frequencies that are too low
     notch_freq += notch_width
 
     # Define sinc function, avoiding division by zero
     def sinc(x):
+        # torch.sinc computes sin(pi * x) / (pi * x) and handles the zero
+        # in a single fused kernel, without slicing and concatenation.
+        if _TORCH_HAS_SINC:
+            return torch.sinc(x / math.pi)
+
         def _sinc(x):
             return torch.sin(x) / x
 
         # The zero is at the middle index
         return torch.cat([_sinc(x[:pad]), torch.ones(1), _sinc(x[pad + 1 :])])
 
+    # The same window is applied to both filters below. Note that the
+    # cached tensors are shared across calls and must not be modified.
+    window = _notch_filter_window(filter_width)
+
     # Compute a low-pass filter with cutoff frequency notch_freq.
     hlpf = sinc(3 * (notch_freq - notch_width) * inputs)
-    hlpf *= torch.blackman_window(filter_width)
+    hlpf *= window
     hlpf /= torch.sum(hlpf)
 
     # Compute a high-pass filter with cutoff frequency notch_freq.
     hhpf = sinc(3 * (notch_freq + notch_width) * inputs)
-    hhpf *= torch.blackman_window(filter_width)
+    hhpf *= window
     hhpf /= -torch.sum(hhpf)
     hhpf[pad] += 1
 
@@ -45,13 +45,60 @@ def undo_padding(batch, lengths):
     return as_list
 
 
+def _fast_walk(dirName):
+    """Yields the path of every file found under dirName, unfiltered.
+
+    The walk uses os.scandir, which reuses the file type reported by the
+    OS instead of issuing a stat call per entry, and is breadth-first:
+    a whole level of directories is scanned back-to-back, so the listing
+    syscalls are issued in batches (which amortizes the per-call latency
+    on network filesystems).
+    """
+    dirs_to_visit = [dirName]
+    while dirs_to_visit:
+        next_level = []
+        for current_dir in dirs_to_visit:
+            with os.scandir(current_dir) as dir_entries:
+                for dir_entry in dir_entries:
+
+                    # With follow_symlinks=False this reads the file type
+                    # cached by scandir, with no extra stat call. DirEntry
+                    # also caches the joined path.
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        next_level.append(dir_entry.path)
+                    else:
+                        yield dir_entry.path
+        dirs_to_visit = next_level
+
+
+def _filtered_walk(
+    dirName, match_and, match_or_re, exclude_and, exclude_or_re
+):
+    """Yields the files under dirName that pass the given filters."""
+    for fullPath in _fast_walk(dirName):
+
+        # Apply the match/exclude filters, short-circuiting on the
+        # first one that rejects the file.
+        if match_and and not all(e in fullPath for e in match_and):
+            continue
+        if match_or_re and not match_or_re.search(fullPath):
+            continue
+        if exclude_and and all(e in fullPath for e in exclude_and):
+            continue
+        if exclude_or_re and exclude_or_re.search(fullPath):
+            continue
+
+        yield fullPath
+
+
 def get_all_files(
     dirName, match_and=None, match_or=None, exclude_and=None, exclude_or=None
 ):
     """Returns a list of files found within a folder.
 
     Different options can be used to restrict the search to some specific
-    patterns.
+    patterns. Symbolic links to directories are not followed (matching the
+    default behavior of ``find``), so link cycles cannot hang the search.
 
     Arguments
     ---------
@@ -76,80 +123,30 @@ def get_all_files(
     ['samples/rir_samples/rir3.wav']
     """
 
-    # Match/exclude variable initialization
-    match_and_entry = True
-    match_or_entry = True
-    exclude_or_entry = False
-    exclude_and_entry = False
-
-    # Create a list of file and sub directories
-    listOfFile = os.listdir(dirName)
-    allFiles = list()
-
-    # Iterate over all the entries
-    for entry in listOfFile:
-
-        # Create full path
-        fullPath = os.path.join(dirName, entry)
-
-        # If entry is a directory then get the list of files in this directory
-        if os.path.isdir(fullPath):
-            allFiles = allFiles + get_all_files(
-                fullPath,
-                match_and=match_and,
-                match_or=match_or,
-                exclude_and=exclude_and,
-                exclude_or=exclude_or,
-            )
-        else:
-
-            # Check match_and case
-            if match_and is not None:
-                match_and_entry = False
-                match_found = 0
-
-                for ele in match_and:
-                    if ele in fullPath:
-                        match_found = match_found + 1
-                if match_found == len(match_and):
-                    match_and_entry = True
-
-            # Check match_or case
-            if match_or is not None:
-                match_or_entry = False
-                for ele in match_or:
-                    if ele in fullPath:
-                        match_or_entry = True
-                        break
-
-            # Check exclude_and case
-            if exclude_and is not None:
-                match_found = 0
-
-                for ele in exclude_and:
-                    if ele in fullPath:
-                        match_found = match_found + 1
-                if match_found == len(exclude_and):
-                    exclude_and_entry = True
-
-            # Check exclude_and case
-            if exclude_or is not None:
-                exclude_or_entry = False
-                for ele in exclude_or:
-                    if ele in fullPath:
-                        exclude_or_entry = True
-                        break
-
-            # If needed, append the current file to the output list
-            if (
-                match_and_entry
-                and match_or_entry
-                and not (exclude_and_entry)
-                and not (exclude_or_entry)
-            ):
-                allFiles.append(fullPath)
-
-    return allFiles
+    # Fast path: without filters, just collect every file.
+    if match_and is match_or is exclude_and is exclude_or is None:
+        return list(_fast_walk(dirName))
+
+    # Preprocess the filters once here, so the walk below only reads
+    # fixed filter objects. The "and" pattern lists are frozen into
+    # tuples, immune to caller mutation while the walk runs.
+    match_and = tuple(match_and) if match_and else ()
+    exclude_and = tuple(exclude_and) if exclude_and else ()
+
+    # Compile the "or" pattern lists into single alternation regexes, so
+    # each path is scanned once at C level instead of once per pattern.
+    match_or_re = None
+    if match_or:
+        match_or_re = re.compile("|".join(map(re.escape, match_or)))
+    exclude_or_re = None
+    if exclude_or:
+        exclude_or_re = re.compile("|".join(map(re.escape, exclude_or)))
+
+    return list(
+        _filtered_walk(
+            dirName, match_and, match_or_re, exclude_and, exclude_or_re
+        )
+    )
 
 
 def split_list(seq, num):
@@ -167,15 +164,19 @@ def split_list(seq, num):
     >>> split_list([1, 2, 3, 4, 5, 6, 7, 8, 9], 4)
     [[1, 2], [3, 4], [5, 6], [7, 8, 9]]
     """
-    # Average length of the chunk
-    avg = len(seq) / float(num)
-    out = []
-    last = 0.0
+    if not seq:
+        return []
 
-    # Creating the chunks
-    while last < len(seq):
-        out.append(seq[int(last) : int(last + avg)])
-        last += avg
+    # Integer quotient/remainder avoids the float accumulation error of
+    # stepping by len(seq) / num, which could produce num + 1 chunks.
+    # The r leftover items go to the last r chunks.
+    q, r = divmod(len(seq), num)
+    out = []
+    last = 0
+    for i in range(num):
+        end = last + q + (1 if i >= num - r else 0)
+        out.append(seq[last:end])
+        last = end
 
     return out
 
@@ -198,11 +199,17 @@ def recursive_items(dictionary):
     >>> [item for item in recursive_items(rec_dict)]
     [('lev3', 'current_val')]
     """
-    for key, value in dictionary.items():
-        if type(value) is dict:
-            yield from recursive_items(value)
-        else:
+    # Walk with an explicit stack of item iterators, avoiding a Python
+    # call frame per nesting level.
+    stack = [iter(dictionary.items())]
+    while stack:
+        for key, value in stack[-1]:
+            if isinstance(value, collections.abc.Mapping):
+                stack.append(iter(value.items()))
+                break
             yield (key, value)
+        else:
+            stack.pop()
 
 
 def recursive_update(d, u, must_match=False):
@@ -242,17 +249,28 @@ def recursive_update(d, u, must_match=False):
     >>> d
     {'a': 1, 'b': {'c': 2, 'd': 3}}
     """
-    # TODO: Consider cases where u has branch off k, but d does not.
-    # e.g. d = {"a":1}, u = {"a": {"b": 2 }}
-    for k, v in u.items():
-        if isinstance(v, collections.abc.Mapping) and k in d:
-            recursive_update(d.get(k, {}), v)
-        elif must_match and k not in d:
-            raise KeyError(
-                f"Override '{k}' not found in: {[key for key in d.keys()]}"
-            )
-        else:
-            d[k] = v
+    # Walk with an explicit stack of mapping pairs. Note that must_match
+    # is only enforced on the top level, as before.
+    stack = collections.deque([(d, u, must_match)])
+    while stack:
+        d_sub, u_sub, check = stack.popleft()
+        for k, v in u_sub.items():
+            if isinstance(v, collections.abc.Mapping):
+                if check and k not in d_sub:
+                    raise KeyError(
+                        f"Override '{k}' not found in: "
+                        f"{[key for key in d_sub.keys()]}"
+                    )
+                # Create the branch in d when absent, rather than
+                # aliasing the subdict of u.
+                stack.append((d_sub.setdefault(k, {}), v, False))
+            elif check and k not in d_sub:
+                raise KeyError(
+                    f"Override '{k}' not found in: "
+                    f"{[key for key in d_sub.keys()]}"
+                )
+            else:
+                d_sub[k] = v
 
 
 def download_file(